@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Shared cache for the decoded logo.png
+
+The scripts in this directory all start from the same source image. Caching
+the decode means a build runner that imports several of them in one Python
+process pays the PNG inflate/unfilter cost only once.
+"""
+
+import functools
+
+import numpy as np
+from PIL import Image
+
+@functools.lru_cache(maxsize=1)
+def load_logo(path="logo.png"):
+    """Open and fully decode the logo, cached per process"""
+    img = Image.open(path)
+    img.load()
+    return img
+
+@functools.lru_cache(maxsize=1)
+def load_logo_pixels(path="logo.png"):
+    """Decoded logo as a NumPy array, for consumers that only need pixels"""
+    return np.asarray(load_logo(path))
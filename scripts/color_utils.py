@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Shared hex -> HSL color conversion for the color scripts"""
+
+import numpy as np
+
+def hex_to_hsl_batch(hex_colors):
+    """Convert a sequence of hex colors to HSL in one vectorized pass"""
+    # bytes.fromhex parses all channel pairs in one C call, so no per-channel
+    # int(..., 16) slicing
+    raw = bytes.fromhex(''.join(c.lstrip('#') for c in hex_colors))
+    rgb = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.float64) / 255.0
+
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    max_c = rgb.max(axis=1)
+    min_c = rgb.min(axis=1)
+    delta = max_c - min_c
+
+    # np.select evaluates every branch, so silence the delta == 0 divisions
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Hue
+        h = np.select(
+            [delta == 0, max_c == r, max_c == g],
+            [
+                np.zeros_like(delta),
+                60 * (((g - b) / delta) % 6),
+                60 * (((b - r) / delta) + 2),
+            ],
+            default=60 * (((r - g) / delta) + 4),
+        )
+
+        # Lightness
+        l = (max_c + min_c) / 2
+
+        # Saturation
+        s = np.where(delta == 0, 0, delta / (1 - np.abs(2 * l - 1)))
+
+    return [
+        f"{round(hv)} {round(sv * 100)}% {round(lv * 100)}%"
+        for hv, sv, lv in zip(h, s, l)
+    ]
+
+def hex_to_hsl(hex_color):
+    """Convert hex color to HSL"""
+    return hex_to_hsl_batch([hex_color])[0]
@@ -1,20 +1,28 @@
 #!/usr/bin/env python3
 """Extract dominant color from logo.png"""
 
-from PIL import Image
+import numpy as np
 import sys
 
-# Open the logo
-img = Image.open("logo.png")
+from _logo_cache import load_logo, load_logo_pixels
 
-# Resize to 1x1 to get average color
-small_img = img.resize((1, 1))
-avg_color = small_img.getpixel((0, 0))
+# Open the logo (shared decode cache with the other logo scripts)
+img = load_logo()
+
+# One NumPy view over the decoded pixels replaces per-pixel getpixel calls
+# (indexed [row, col], i.e. [y, x])
+pixels = load_logo_pixels()
+
+# True arithmetic mean over all pixels; resizing to 1x1 ran a full LANCZOS
+# convolution just to approximate this
+avg_color = tuple(
+    int(v) for v in pixels.reshape(-1, pixels.shape[-1]).mean(axis=0).round()
+)
 
 # Get color from corners (logo likely has gradient)
-top_left = img.getpixel((100, 100))
-bottom_right = img.getpixel((img.width - 100, img.height - 100))
-center = img.getpixel((img.width // 2, img.height // 2))
+top_left = tuple(int(v) for v in pixels[100, 100])
+bottom_right = tuple(int(v) for v in pixels[img.height - 100, img.width - 100])
+center = tuple(int(v) for v in pixels[img.height // 2, img.width // 2])
 
 print(f"Average color: rgb{avg_color}")
 print(f"Top-left (darker): rgb{top_left}")
@@ -7,9 +7,9 @@ Design: A stylized coin/chart symbol representing financial tracking
 import base64
 from pathlib import Path
 
-def generate_favicon_svg():
-    """Generate an SVG favicon with a financial chart design"""
-    svg = '''<?xml version="1.0" encoding="UTF-8"?>
+# The SVG favicon is a fixed design, so build the string once at import time
+# instead of reconstructing it on every call.
+_FAVICON_SVG = '''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64">
   <!-- Background circle -->
   <circle cx="32" cy="32" r="30" fill="#059669"/>
@@ -38,39 +38,49 @@ def generate_favicon_svg():
   <circle cx="32" cy="16" r="2" fill="#10B981" opacity="0.8"/>
   <circle cx="32" cy="48" r="2" fill="#10B981" opacity="0.8"/>
 </svg>'''
-    return svg
+
+# Encoded once so writes can go through write_bytes without a per-run
+# UTF-8 encode or TextIOWrapper layer
+_FAVICON_SVG_BYTES = _FAVICON_SVG.encode('utf-8')
+
+def generate_favicon_svg():
+    """Generate an SVG favicon with a financial chart design"""
+    return _FAVICON_SVG
 
 def generate_favicon_png():
-    """Generate a simple PNG favicon using Python PIL if available"""
+    """Generate the favicon image using Python PIL if available
+
+    Returns the PIL Image so callers can encode it as PNG and ICO without
+    a decode round-trip, or None when PIL is not installed.
+    """
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        import io
+        from PIL import Image
+        import numpy as np
 
-        # Create image with green background
+        # Build the pixel buffer directly with NumPy instead of issuing
+        # per-primitive ImageDraw calls: slice assignment for the rectangles
+        # and one precomputed radial mask for both circles.
         size = 64
-        img = Image.new('RGBA', (size, size), (5, 150, 105, 255))
-        draw = ImageDraw.Draw(img)
+        arr = np.full((size, size, 4), (5, 150, 105, 255), dtype=np.uint8)
+
+        y, x = np.ogrid[:size, :size]
+        dist_sq = (x - size // 2) ** 2 + (y - size // 2) ** 2
 
         # Draw outer ring
-        draw.ellipse([2, 2, size-2, size-2], outline=(16, 185, 129, 255), width=2)
+        arr[(dist_sq >= 28 ** 2) & (dist_sq <= 30 ** 2)] = (16, 185, 129, 255)
 
         # Draw inner circle
-        draw.ellipse([12, 12, size-12, size-12], fill=(6, 95, 70, 255))
+        arr[dist_sq <= 20 ** 2] = (6, 95, 70, 255)
 
-        # Draw ¥ symbol
+        # Draw ¥ symbol (slices are [top:bottom, left:right])
         # Vertical line
-        draw.rectangle([29, 16, 35, 46], fill=(52, 211, 153, 255))
+        arr[16:47, 29:36] = (52, 211, 153, 255)
         # Top line
-        draw.rectangle([18, 21, 46, 25], fill=(52, 211, 153, 255))
+        arr[21:26, 18:47] = (52, 211, 153, 255)
         # Middle line
-        draw.rectangle([20, 28, 44, 32], fill=(52, 211, 153, 255))
+        arr[28:33, 20:45] = (52, 211, 153, 255)
 
-        # Save to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-
-        return img_bytes.read()
+        return Image.fromarray(arr, 'RGBA')
     except ImportError:
         return None
 
@@ -79,28 +89,24 @@ def main():
     output_dir.mkdir(exist_ok=True)
 
     # Generate SVG favicon
-    svg_content = generate_favicon_svg()
     svg_path = output_dir / 'favicon.svg'
-    svg_path.write_text(svg_content, encoding='utf-8')
+    svg_path.write_bytes(_FAVICON_SVG_BYTES)
     print(f"✓ Generated SVG favicon: {svg_path}")
 
-    # Try to generate PNG/ICO if PIL is available
-    try:
-        from PIL import Image
-
-        png_data = generate_favicon_png()
-        if png_data:
-            # Save PNG
-            png_path = output_dir / 'favicon-64x64.png'
-            png_path.write_bytes(png_data)
-            print(f"✓ Generated PNG favicon: {png_path}")
-
-            # Generate ICO
-            img = Image.open(io.BytesIO(png_data))
-            ico_path = output_dir / 'favicon.ico'
-            img.save(ico_path, format='ICO', sizes=[(32, 32), (64, 64)])
-            print(f"✓ Generated ICO favicon: {ico_path}")
-    except ImportError:
+    # Try to generate PNG/ICO if PIL is available; both formats are encoded
+    # from the same in-memory image so the PNG is never decoded back.
+    img = generate_favicon_png()
+    if img is not None:
+        # Save PNG
+        png_path = output_dir / 'favicon-64x64.png'
+        img.save(png_path, format='PNG')
+        print(f"✓ Generated PNG favicon: {png_path}")
+
+        # Generate ICO
+        ico_path = output_dir / 'favicon.ico'
+        img.save(ico_path, format='ICO', sizes=[(32, 32), (64, 64)])
+        print(f"✓ Generated ICO favicon: {ico_path}")
+    else:
         print("⚠ PIL not available, only SVG favicon generated")
         print("  Install with: pip install pillow")
 
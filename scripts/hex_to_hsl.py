@@ -1,41 +1,7 @@
 #!/usr/bin/env python3
 """Convert logo color to HSL for CSS variables"""
 
-def hex_to_hsl(hex_color):
-    """Convert hex color to HSL"""
-    hex_color = hex_color.lstrip('#')
-    r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-    r, g, b = r / 255.0, g / 255.0, b / 255.0
-
-    max_c = max(r, g, b)
-    min_c = min(r, g, b)
-    delta = max_c - min_c
-
-    # Hue
-    if delta == 0:
-        h = 0
-    elif max_c == r:
-        h = 60 * (((g - b) / delta) % 6)
-    elif max_c == g:
-        h = 60 * (((b - r) / delta) + 2)
-    else:
-        h = 60 * (((r - g) / delta) + 4)
-
-    # Lightness
-    l = (max_c + min_c) / 2
-
-    # Saturation
-    if delta == 0:
-        s = 0
-    else:
-        s = delta / (1 - abs(2 * l - 1))
-
-    h = round(h)
-    s = round(s * 100)
-    l = round(l * 100)
-
-    return f"{h} {s}% {l}%"
+from color_utils import hex_to_hsl_batch
 
 # Logo colors from analysis
 logo_colors = {
@@ -46,15 +12,12 @@ logo_colors = {
 
 print("CSS HSL values for logo colors:")
 print("=" * 50)
-for name, hex_color in logo_colors.items():
-    hsl = hex_to_hsl(hex_color)
+for (name, hex_color), hsl in zip(logo_colors.items(), hex_to_hsl_batch(logo_colors.values())):
     print(f"{name:25s}: {hex_color} -> {hsl}")
 print()
 
 # Primary color suggestions
-primary = hex_to_hsl("#3b5894")
-primary_light = hex_to_hsl("#6d82ad")
-primary_dark = hex_to_hsl("#2a4580")
+primary, primary_light, primary_dark = hex_to_hsl_batch(["#3b5894", "#6d82ad", "#2a4580"])
 
 print("Recommended CSS variables:")
 print("=" * 50)